@@ -8,6 +8,9 @@ GAMES_AMOUNT = 20000        # Cantidad total de juegos a simular
 PLAYERS_PER_TEAM = 5        # Número de jugadores por equipo
 ROUNDS_PER_GAME = 10        # Número de rondas por cada juego
 
+# Constantes precalculadas
+TWO_PI = 2 * math.pi        # Factor angular de la transformación Box-Muller
+
 class Model:
     """
     Clase principal del modelo de simulación de juegos.
@@ -32,11 +35,13 @@ class Model:
             numbers: Lista que almacena todos los números cargados del CSV
             current_number: Índice del próximo número a consumir
             total_numbers_loaded: Total de números cargados exitosamente
+            games_aggregates: Totales de los juegos calculados en un solo recorrido
         """
         self.csv_file = csv_file
         self.numbers = []                # Lista de números pseudoaleatorios del CSV
         self.current_number = 0          # Índice del próximo número a usar
         self.total_numbers_loaded = 0    # Contador total de números disponibles
+        self.games_aggregates = None     # Caché de totales de juegos (ver calculate_games_aggregates)
         self.load_numbers_from_csv()     # Carga automática al inicializar
 
     def set_presenter(self, presenter):
@@ -274,6 +279,8 @@ class Model:
         
         # ===== FASE 2: SIMULACIÓN DE JUEGOS =====
         self.games : list[Game] = []
+        self.games_aggregates = None  # Invalida los totales de una simulación anterior
+        self.total_shots = 0          # Disparos generados, contados al crear cada ronda
         games_start_time = time.time()
         
         # Configurar progreso (mostrar 10 actualizaciones)
@@ -291,6 +298,7 @@ class Model:
                     
                     # Generar disparos y valores de resistencia
                     shots, endurance_values = self.generate_shots_and_endurance_values(luck_values, rounds)
+                    self.total_shots += len(shots)
                     
                     # Calcular ganador de la ronda
                     winner_player, winner_team = self.calculate_winner(shots)
@@ -314,6 +322,8 @@ class Model:
                     print(f"⏳ Progreso: {progress:5.1f}% ({i+1:,}/{GAMES_AMOUNT:,}) | "
                           f"📊 Números: {stats['used']:,} ({stats['percentage_used']:4.1f}%) | "
                           f"🚀 Velocidad: {rate:.1f} juegos/s")
+                    # Reportar el avance a la interfaz (la vista lo encola; seguro desde este hilo)
+                    self.presenter.update_progress(progress)
                         
         except IndexError as e:
             # Manejo de error por números agotados
@@ -499,7 +509,7 @@ class Model:
         u2 = max(1e-10, min(1 - 1e-10, u2))
         
         # Aplicar transformación Box-Muller
-        z0 = (-2 * math.log(u1))**0.5 * math.cos(2 * math.pi * u2)
+        z0 = (-2 * math.log(u1))**0.5 * math.cos(TWO_PI * u2)
         return mu + sigma * z0
    
     def generate_shots_and_endurance_values(self, luck_values: list[LuckValue], rounds: list[Round]):
@@ -845,30 +855,23 @@ class Model:
         winner_team = list(filter(lambda tm: tm.name == max_tm_name, self.teams))[0]
         
         # Contar victorias por ronda y apariciones como afortunado
-        rds_winners = []  # Ganadores por ronda
-        lks_winners = []  # Apariciones como afortunado
-        
+        # (diccionarios por jugador: conteo O(1) en lugar de buscar en listas)
+        rds_winners = {}  # Ganadores por ronda
+        lks_winners = {}  # Apariciones como afortunado
+
         for round in rounds:
             # Procesar valores de suerte
             for luck_value in round.luck_values:
-                if luck_value.player.name in [lk_w['player'].name for lk_w in lks_winners]:
-                    list(filter(lambda lk_w: lk_w['player'].name == luck_value.player.name, lks_winners))[0]['amount'] += 1
-                else:
-                    lks_winners.append({"player": luck_value.player, "amount": 1})
-            
+                lks_winners[luck_value.player] = lks_winners.get(luck_value.player, 0) + 1
+
             # Procesar ganadores de ronda
-            if round.winner_player.name in [rd_w['player'].name for rd_w in rds_winners]:
-                list(filter(lambda rd_w: rd_w['player'].name == round.winner_player.name, rds_winners))[0]['amount'] += 1
-            else:
-                rds_winners.append({"player": round.winner_player, "amount": 1})
-        
-        # Determinar jugador que ganó más rondas
-        max_round_wins = max([rd_w['amount'] for rd_w in rds_winners])
-        winner_player = list(filter(lambda rd_w: rd_w['amount'] == max_round_wins, rds_winners))[0]['player']
-        
+            rds_winners[round.winner_player] = rds_winners.get(round.winner_player, 0) + 1
+
+        # Determinar jugador que ganó más rondas (el primero en aparecer si hay empate)
+        winner_player = max(rds_winners, key=rds_winners.get)
+
         # Determinar jugador más afortunado
-        max_luck_appearances = max([lk_w['amount'] for lk_w in lks_winners])
-        luckiest_player = list(filter(lambda lk_w: lk_w['amount'] == max_luck_appearances, lks_winners))[0]['player']
+        luckiest_player = max(lks_winners, key=lks_winners.get)
         
         return winner_player, winner_team, luckiest_player
 
@@ -876,6 +879,77 @@ class Model:
     # MÉTODOS DE ANÁLISIS ESTADÍSTICO - Procesan resultados finales
     # ===================================================================
 
+    def calculate_games_aggregates(self):
+        """
+        Recorre juegos, rondas y disparos una sola vez y acumula los totales
+        que necesitan los análisis estadísticos.
+        
+        El resultado queda en caché (self.games_aggregates), de modo que los
+        análisis lo comparten en lugar de volver a recorrer self.games cada uno.
+        
+        Returns:
+            dict: Totales acumulados de la simulación
+                - team_scores: Puntuación por juego de cada equipo (clave: nombre del equipo)
+                - team_score_sums: Suma de las puntuaciones por juego de cada equipo
+                - team_score_squares: Suma de los cuadrados de esas puntuaciones
+                - special_shots: Disparos LS y AS de cada equipo (clave: nombre del equipo)
+                - player_points: Puntos por juego de cada jugador (clave: Player)
+                - tied_rounds: Rondas sin equipo ganador
+                - male_round_wins: Rondas ganadas por hombres
+                - female_round_wins: Rondas ganadas por mujeres
+        """
+        if self.games_aggregates is not None:
+            return self.games_aggregates
+        
+        tied_rounds = 0
+        male_round_wins = 0
+        female_round_wins = 0
+        team_scores = {team.name: [] for team in self.teams}
+        team_score_sums = {team.name: 0 for team in self.teams}
+        team_score_squares = {team.name: 0 for team in self.teams}
+        special_shots = {team.name: 0 for team in self.teams}
+        player_points = {player: [] for player in self.players}
+        
+        for game in self.games:
+            game_team_scores = {team.name: 0 for team in self.teams}
+            game_player_points = {player: 0 for player in self.players}
+            
+            for round_game in game.rounds:
+                if round_game.winner_team is None:  # Empate
+                    tied_rounds += 1
+                if round_game.winner_player.is_male:
+                    male_round_wins += 1
+                else:
+                    female_round_wins += 1
+                
+                for shot in round_game.shots:
+                    game_player_points[shot.player] += shot.score
+                    # Puntos para equipos (solo disparos NS, LS, AS)
+                    if shot.type in ["NS", "LS", "AS"]:
+                        game_team_scores[shot.player.team.name] += shot.score
+                    # Disparos especiales (LS, AS)
+                    if shot.type in ["LS", "AS"]:
+                        special_shots[shot.player.team.name] += 1
+            
+            for team_name, score in game_team_scores.items():
+                team_scores[team_name].append(score)
+                team_score_sums[team_name] += score
+                team_score_squares[team_name] += score * score
+            for player, points in game_player_points.items():
+                player_points[player].append(points)
+        
+        self.games_aggregates = {
+            "team_scores": team_scores,
+            "team_score_sums": team_score_sums,
+            "team_score_squares": team_score_squares,
+            "special_shots": special_shots,
+            "player_points": player_points,
+            "tied_rounds": tied_rounds,
+            "male_round_wins": male_round_wins,
+            "female_round_wins": female_round_wins
+        }
+        return self.games_aggregates
+
     def calculate_luckiest_player_per_games(self):
         """
         Identifica al jugador más afortunado a lo largo de todos los juegos.
@@ -1009,17 +1083,10 @@ class Model:
         - Este cuenta TODAS las rondas individuales
         - El anterior solo contaba juegos completos
         """
-        male_wins = 0
-        female_wins = 0
-        
-        # Contar todas las victorias de ronda por género
-        for game in self.games:
-            for round_game in game.rounds:
-                winner_player = round_game.winner_player
-                if winner_player.is_male:
-                    male_wins += 1
-                else:
-                    female_wins += 1
+        # Victorias de ronda por género (acumuladas en el recorrido único)
+        aggregates = self.calculate_games_aggregates()
+        male_wins = aggregates["male_round_wins"]
+        female_wins = aggregates["female_round_wins"]
         
         # Determinar género ganador
         winner_gender = "Hombres" if male_wins > female_wins else "Mujeres"
@@ -1044,24 +1111,9 @@ class Model:
         - Identificar patrones de mejora o declive
         - Crear gráficas de rendimiento temporal
         """
-        players_with_points = [{"player": player, "points": []} for player in self.players]
-        
-        # Procesar cada juego
-        for game in self.games:
-            # Inicializar puntos por jugador para este juego
-            game_points = {player.name: 0 for player in self.players}
-            
-            # Sumar puntos de todas las rondas del juego
-            for round_game in game.rounds:
-                for shot in round_game.shots:
-                    game_points[shot.player.name] += shot.score
-            
-            # Agregar puntos del juego al historial de cada jugador
-            for player_points in players_with_points:
-                player_name = player_points["player"].name
-                player_points["points"].append(game_points.get(player_name, 0))
+        player_points = self.calculate_games_aggregates()["player_points"]
         
-        return players_with_points
+        return [{"player": player, "points": player_points[player]} for player in self.players]
 
     def calculate_team_score_distribution(self):
         """
@@ -1081,33 +1133,26 @@ class Model:
         - Varianza: Qué tan dispersas están las puntuaciones
         - Desv. estándar: Consistencia del rendimiento
         """
-        team_a_scores = []
-        team_b_scores = []
-        
-        # Calcular puntuación por equipo en cada juego
-        for game in self.games:
-            team_a_game_score = 0
-            team_b_game_score = 0
-            
-            # Sumar puntos de todos los disparos válidos para equipos
-            for round_game in game.rounds:
-                for shot in round_game.shots:
-                    if shot.player.team.name == "Team A" and shot.type in ["NS", "LS", "AS"]:
-                        team_a_game_score += shot.score
-                    elif shot.player.team.name == "Team B" and shot.type in ["NS", "LS", "AS"]:
-                        team_b_game_score += shot.score
-            
-            team_a_scores.append(team_a_game_score)
-            team_b_scores.append(team_b_game_score)
-        
+        # Puntuación por equipo en cada juego y sus sumas (acumuladas en el recorrido único)
+        aggregates = self.calculate_games_aggregates()
+        team_scores = aggregates["team_scores"]
+        sums = aggregates["team_score_sums"]
+        squares = aggregates["team_score_squares"]
+        team_a_scores = team_scores["Team A"]
+        team_b_scores = team_scores["Team B"]
+        
+        # Las puntuaciones son enteras: con las sumas exactas, la varianza poblacional
+        # (n·Σx² - (Σx)²) / n² sale sin volver a recorrer las listas ni errores de redondeo
         # Calcular estadísticas para Team A
-        team_a_avg = sum(team_a_scores) / len(team_a_scores)
-        team_a_variance = sum((score - team_a_avg) ** 2 for score in team_a_scores) / len(team_a_scores)
+        n_a = len(team_a_scores)
+        team_a_avg = sums["Team A"] / n_a
+        team_a_variance = (n_a * squares["Team A"] - sums["Team A"] ** 2) / n_a ** 2
         team_a_std = team_a_variance ** 0.5
         
         # Calcular estadísticas para Team B
-        team_b_avg = sum(team_b_scores) / len(team_b_scores)
-        team_b_variance = sum((score - team_b_avg) ** 2 for score in team_b_scores) / len(team_b_scores)
+        n_b = len(team_b_scores)
+        team_b_avg = sums["Team B"] / n_b
+        team_b_variance = (n_b * squares["Team B"] - sums["Team B"] ** 2) / n_b ** 2
         team_b_std = team_b_variance ** 0.5
         
         return {
@@ -1148,18 +1193,10 @@ class Model:
         - Ventajas estratégicas por suerte
         - Relación entre suerte y experiencia ganada
         """
-        team_a_special_shots = 0
-        team_b_special_shots = 0
-        
-        # Contar disparos especiales por equipo
-        for game in self.games:
-            for round_game in game.rounds:
-                for shot in round_game.shots:
-                    if shot.type in ["LS", "AS"]:
-                        if shot.player.team.name == "Team A":
-                            team_a_special_shots += 1
-                        else:
-                            team_b_special_shots += 1
+        # Disparos especiales por equipo (acumulados en el recorrido único)
+        special_shots = self.calculate_games_aggregates()["special_shots"]
+        team_a_special_shots = special_shots["Team A"]
+        team_b_special_shots = special_shots["Team B"]
         
         # Calcular promedios
         team_a_avg_special = team_a_special_shots / GAMES_AMOUNT
@@ -1212,15 +1249,9 @@ class Model:
         - Evaluar balance del sistema de puntuación
         - Analizar efectividad del sistema de desempate
         """
-        tied_rounds_count = 0
+        tied_rounds_count = self.calculate_games_aggregates()["tied_rounds"]
         total_rounds = GAMES_AMOUNT * ROUNDS_PER_GAME
         
-        # Contar rondas empatadas
-        for game in self.games:
-            for round_game in game.rounds:
-                if round_game.winner_team is None:  # Empate
-                    tied_rounds_count += 1
-        
         # Calcular frecuencias
         tied_frequency = (tied_rounds_count / total_rounds) * 100
         
@@ -1263,20 +1294,26 @@ class Model:
         - Evaluación cualitativa del rendimiento
         """
         # Calcular volúmenes de datos procesados
-        total_shots = sum(len(round.shots) for game in self.games for round in game.rounds)
+        total_shots = self.total_shots  # Contado durante la generación de rondas
         total_rounds = len(self.games) * ROUNDS_PER_GAME
         total_luck_calculations = total_rounds * 2  # 2 jugadores afortunados por ronda
+        csv_memory_mb = len(self.numbers) * 8 // 1024 // 1024  # Aproximado para floats
+        
+        # Factores inversos de tiempo, calculados una vez (0 si el tiempo no es medible)
+        inv_games_time = 1.0 / games_generation_time if games_generation_time > 0 else 0.0
+        inv_total_time = 1.0 / total_time if total_time > 0 else 0.0
         
         # Calcular velocidades de procesamiento
-        games_per_second = GAMES_AMOUNT / games_generation_time if games_generation_time > 0 else 0
-        rounds_per_second = total_rounds / games_generation_time if games_generation_time > 0 else 0
-        shots_per_second = total_shots / games_generation_time if games_generation_time > 0 else 0
-        numbers_per_second = numbers_consumed / games_generation_time if games_generation_time > 0 else 0
+        games_per_second = GAMES_AMOUNT * inv_games_time
+        rounds_per_second = total_rounds * inv_games_time
+        shots_per_second = total_shots * inv_games_time
+        numbers_per_second = numbers_consumed * inv_games_time
+        luck_calculations_per_second = total_luck_calculations * inv_games_time
         
         # Calcular distribución de tiempo
-        setup_percentage = (setup_time / total_time) * 100
-        games_percentage = (games_generation_time / total_time) * 100
-        analysis_percentage = (analysis_time / total_time) * 100
+        setup_percentage = setup_time * inv_total_time * 100
+        games_percentage = games_generation_time * inv_total_time * 100
+        analysis_percentage = analysis_time * inv_total_time * 100
         
         # Métricas de eficiencia de números
         numbers_efficiency = {
@@ -1295,7 +1332,7 @@ class Model:
             "total_rounds_stored": total_rounds,
             "total_shots_stored": total_shots,
             "average_shots_per_round": total_shots / total_rounds if total_rounds > 0 else 0,
-            "csv_memory_footprint": f"{len(self.numbers) * 8 // 1024 // 1024} MB"  # Aproximado para floats
+            "csv_memory_footprint": f"{csv_memory_mb} MB"
         }
         
         return {
@@ -1316,7 +1353,7 @@ class Model:
                 "rounds_per_second": round(rounds_per_second, 2),
                 "shots_per_second": round(shots_per_second, 2),
                 "numbers_per_second": round(numbers_per_second, 2),
-                "luck_calculations_per_second": round(total_luck_calculations / games_generation_time, 2) if games_generation_time > 0 else 0
+                "luck_calculations_per_second": round(luck_calculations_per_second, 2)
             },
             "data_volume": {
                 "total_games": GAMES_AMOUNT,
@@ -1331,13 +1368,13 @@ class Model:
             "csv_performance": {
                 "csv_source": self.csv_file,
                 "total_numbers_loaded": self.total_numbers_loaded,
-                "peak_memory_usage": f"~{len(self.numbers) * 8 // 1024 // 1024} MB",
-                "numbers_consumption_rate": round(numbers_consumed / total_time, 2),
+                "peak_memory_usage": f"~{csv_memory_mb} MB",
+                "numbers_consumption_rate": round(numbers_consumed * inv_total_time, 2),
                 "csv_read_efficiency": "Single load at startup - optimal for multiple simulations"
             },
             "system_performance": {
-                "throughput_score": round((total_shots + total_luck_calculations) / total_time, 2),
-                "efficiency_ratio": round(games_generation_time / total_time, 3),
+                "throughput_score": round((total_shots + total_luck_calculations) * inv_total_time, 2),
+                "efficiency_ratio": round(games_generation_time * inv_total_time, 3),
                 "processing_intensity": "High" if shots_per_second > 1000 else "Medium" if shots_per_second > 100 else "Low",
                 "numbers_utilization": numbers_efficiency["csv_utilization_efficiency"],
                 "overall_performance": "Excellent" if games_per_second > 50 else "Good" if games_per_second > 20 else "Fair"
@@ -8,5 +8,8 @@ class Presenter:
     def start_simulation(self):
         self.model.start_simulation()
 
+    def update_progress(self, pct):
+        self.view.set_loading_progress(pct)
+
     def show_results(self, results):
         self.view.show_results(results)
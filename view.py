@@ -2,17 +2,56 @@ from model import Model
 from presenter import Presenter
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 import threading
-import matplotlib.pyplot as plt
+import queue
+import base64
+import io
+from functools import partial, lru_cache
+
+# Fuentes compartidas por toda la interfaz: se crean una sola vez (necesitan un
+# intérprete Tk) y todos los widgets reutilizan el mismo objeto de fuente de Tk
+_FONT_SPECS = {
+    "10": (10, "normal"),
+    "11": (11, "normal"),
+    "12": (12, "normal"),
+    "12_bold": (12, "bold"),
+    "13_bold": (13, "bold"),
+    "14_bold": (14, "bold"),
+    "16_bold": (16, "bold"),
+    "20": (20, "normal"),
+    "20_bold": (20, "bold"),
+}
+_FONTS = {}
+
+
+def create_fonts(root):
+    """Crea las fuentes compartidas de la interfaz si todavía no existen."""
+    if not _FONTS:
+        for key, (size, weight) in _FONT_SPECS.items():
+            _FONTS[key] = tkfont.Font(root=root, family="Arial", size=size, weight=weight)
+
 
 class LoadingBar:
     """Barra de progreso centrada para mostrar el avance de la simulación."""
+
+    # Cuadros por segundo de la animación indeterminada; nunca se anima más rápido que
+    # el refresco de pantalla de la ventana (View.refresh_hz)
+    ANIMATION_FPS = 25
     
     def __init__(self, root: tk.Tk):
         self.root = root
 
+        # Periodo del temporizador y máximo de la barra: con un paso por cuadro, un
+        # máximo igual a los fps hace que la barra recorra su ancho en ~1 s
+        fps = min(self.ANIMATION_FPS, root.winfo_toplevel().refresh_hz)
+        self._animation_interval = max(8, int(1000 / fps))
+        self._animation_maximum = max(1, round(1000 / self._animation_interval))
+
         # Contenedor principal que ocupa toda la ventana
-        self.container = tk.Frame(root, bg=root.cget("bg"))
+        # Color de fondo leído una sola vez y compartido por todos los widgets de la barra
+        bg = root.cget("bg")
+        self.container = tk.Frame(root, bg=bg)
         self.container.pack(fill=tk.BOTH, expand=True)
 
         # Configuración robusta de estilo para la barra de progreso
@@ -33,7 +72,7 @@ class LoadingBar:
                 pb_style = 'TProgressbar'
 
         # Frame interno centrado para la barra de progreso
-        self.inner = tk.Frame(self.container, bg=self.container.cget("bg"))
+        self.inner = tk.Frame(self.container, bg=bg)
         self.inner.place(relx=0.5, rely=0.5, anchor="center")
 
         # Barra de progreso con longitud aumentada para mejor visibilidad
@@ -43,64 +82,364 @@ class LoadingBar:
         self.progress.pack(pady=6)
 
         # Etiqueta para mostrar porcentaje de progreso
-        self.info = tk.Label(self.inner, text="", font=("Arial", 10), bg=self.container.cget("bg"))
+        self.info = tk.Label(self.inner, text="", font=_FONTS["10"], bg=bg)
         self.info.pack()
 
         self._determinate = False
         self._value = 0
 
+        # Actualizaciones de progreso pendientes: se aplican en un único repintado ocioso
+        self._pending_pct = None
+        self._flush_id = None
+
     def start_indeterminate(self):
         """Inicia la barra en modo indeterminado (animación continua)."""
-        try:
-            self.progress.config(mode="indeterminate")
-            self.progress.start(10)
-            self._determinate = False
-        except Exception:
-            pass
+        self.progress.config(mode="indeterminate", maximum=self._animation_maximum)
+        self.progress.start(self._animation_interval)
+        self._determinate = False
 
     def start_determinate(self, maximum=100):
         """Cambia a modo determinado con valor máximo específico."""
-        try:
-            self.progress.stop()
-            self.progress.config(mode="determinate", maximum=maximum, value=0)
-            self._determinate = True
-            self._value = 0
-        except Exception:
-            pass
+        self.progress.stop()
+        self.progress.config(mode="determinate", maximum=maximum, value=0)
+        self._determinate = True
+        self._value = 0
 
     def set_progress(self, pct: int):
         """Actualiza el progreso y cambia a modo determinado si es necesario."""
         pct = max(0, min(100, int(pct)))
         if not self._determinate:
             self.start_determinate(100)
-        try:
-            self.progress['value'] = pct
-            self._value = pct
-            self.info.config(text=f"{pct}%")
-            self.root.update_idletasks()
-        except Exception:
-            pass
+        self._pending_pct = pct
+        if self._flush_id is None:
+            self._flush_id = self.root.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        """Aplica el último progreso pendiente (varias llamadas se agrupan en un repintado)."""
+        self._flush_id = None
+        self._value = self._pending_pct
+        self.progress['value'] = self._value
+        self.info.config(text=f"{self._value}%")
 
     def stop(self):
         """Detiene la barra y muestra estado completado."""
-        try:
-            if not self._determinate:
-                self.progress.stop()
-            self.progress['value'] = 100
-            self.info.config(text="Completado")
-        except Exception:
-            pass
+        if not self._determinate:
+            self.progress.stop()
+            self.progress.config(maximum=100)
+        self.progress['value'] = 100
+        self.info.config(text="Completado")
 
     def destroy(self):
         """Destruye el contenedor de la barra de progreso."""
+        # Único punto que tolera errores de Tk: la ventana puede estar cerrándose
         try:
+            if self._flush_id is not None:
+                self.root.after_cancel(self._flush_id)
+                self._flush_id = None
             self.container.destroy()
         except Exception:
             pass
 
 
+# Límites de puntos por serie dibujada: con miles de juegos Agg rasteriza cada segmento
+# aunque se superpongan; las series temporales se reducen conservando el mínimo y el
+# máximo de cada tramo (ver envelope_indices), así la envolvente y los picos se mantienen
+PLOT_MAX_POINTS = 2000
+QQ_MAX_POINTS = 1000
+
+# Resolución de las gráficas: a 80 dpi la figura de 15x10 pulgadas cabe en pantalla y
+# el PNG que viaja al proceso de Tk es un 36% más pequeño que con los 100 dpi por defecto
+PLOT_DPI = 80
+
+
+def sample_indices(n, limit):
+    """Devuelve a lo sumo `limit` índices equiespaciados de 0 a n-1 (incluye los extremos)."""
+    import numpy as np
+
+    if n <= limit:
+        return np.arange(n)
+    return np.linspace(0, n - 1, limit).astype(int)
+
+
+def envelope_indices(values, limit):
+    """Devuelve a lo sumo ~`limit` índices ordenados: el mínimo y el máximo de cada tramo de `values`."""
+    import numpy as np
+
+    n = values.size
+    if n <= limit:
+        return np.arange(n)
+    # Tramos de igual ancho; el último se completa repitiendo el valor final, que nunca
+    # gana a su original (argmin/argmax devuelven la primera aparición)
+    width = -(-n // max(1, limit // 2))
+    buckets = -(-n // width)
+    padded = np.pad(values, (0, buckets * width - n), mode='edge').reshape(buckets, width)
+    starts = np.arange(buckets) * width
+    return np.unique(np.concatenate((
+        starts + padded.argmin(axis=1), starts + padded.argmax(axis=1), (0, n - 1),
+    )))
+
+
+def box_stats(values, label=None):
+    """Calcula las estadísticas que dibuja ax.bxp, con el mismo criterio que boxplot (whis=1.5)."""
+    import numpy as np
+
+    # Q1, mediana y Q3 con interpolación lineal (como np.percentile): una sola selección
+    # O(n) con np.partition sobre las posiciones vecinas, sin ordenar ni copiar a máscara
+    positions = np.array([0.25, 0.5, 0.75]) * (values.size - 1)
+    below = positions.astype(np.intp)
+    above = np.minimum(below + 1, values.size - 1)
+    selected = np.partition(values, np.union1d(below, above))
+    q1, med, q3 = selected[below] + (selected[above] - selected[below]) * (positions - below)
+
+    # Bigotes: los datos más extremos dentro de 1.5 IQR (sin pasar del propio cuartil);
+    # con puntajes enteros los atípicos se repiten mucho y basta dibujar cada valor una vez
+    iqr = q3 - q1
+    whislo = min(q1, np.min(values, where=values >= q1 - 1.5 * iqr, initial=np.inf))
+    whishi = max(q3, np.max(values, where=values <= q3 + 1.5 * iqr, initial=-np.inf))
+    stats = {
+        'med': med, 'q1': q1, 'q3': q3, 'whislo': whislo, 'whishi': whishi,
+        'fliers': np.unique(values[(values < whislo) | (values > whishi)]),
+    }
+    if label is not None:
+        stats['label'] = label
+    return stats
+
+
+@lru_cache(maxsize=16)
+def std_normal_quantiles(n):
+    """Devuelve los índices de la rejilla del Q-Q plot para n datos y sus cuantiles normales estándar."""
+    # Solo dependen de n: el proceso de gráficas los reutiliza entre equipos y clics
+    from scipy.special import ndtri
+
+    idx = sample_indices(n, QQ_MAX_POINTS)
+    quantiles = ndtri((idx + 0.5) / n)
+    idx.setflags(write=False)
+    quantiles.setflags(write=False)
+    return idx, quantiles
+
+
+# Estilo común de todos los ejes (rejilla tenue), aplicado al crearlos y en cada cla()
+PLOT_RC = {'axes.grid': True, 'grid.alpha': 0.3}
+
+# Figuras del proceso de gráficas, reutilizadas entre llamadas por (tamaño, filas, columnas)
+_FIGURES = {}
+
+
+def reusable_figure(figsize, nrows=1, ncols=1):
+    """Devuelve una figura de la rejilla indicada y sus ejes limpios, creándola solo la primera vez."""
+    # El proceso de gráficas vive toda la sesión: en lugar de construir Figure y Axes en
+    # cada clic se limpian los ejes existentes (cla suelta los artistas de la gráfica anterior)
+    key = (figsize, nrows, ncols)
+    cached = _FIGURES.get(key)
+    if cached is None:
+        import matplotlib
+        from matplotlib.figure import Figure
+
+        # El proceso de gráficas solo dibuja estas figuras: el estilo puede ser global
+        matplotlib.rcParams.update(PLOT_RC)
+        fig = Figure(figsize=figsize, dpi=PLOT_DPI, layout="constrained")
+        cached = _FIGURES[key] = (fig, fig.subplots(nrows, ncols))
+    else:
+        for ax in cached[0].axes:
+            ax.cla()
+    return cached
+
+
+def figure_to_png(fig):
+    """Serializa la figura a PNG."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+def render_player_graphic(points, player_name):
+    """Dibuja la gráfica de puntos vs juegos con Agg y la devuelve como PNG."""
+    # Corre en el proceso de gráficas: se usa Figure directamente (sin pyplot ni ventanas)
+    import numpy as np
+
+    fig, ax = reusable_figure((12, 8))
+    points = np.asarray(points)
+    idx = envelope_indices(points, PLOT_MAX_POINTS)
+    games = idx + 1
+    sampled_points = points[idx]
+    ax.plot(games, sampled_points, color='blue', linewidth=2, alpha=0.7)
+    ax.scatter(games, sampled_points, color='red', s=20, alpha=0.6)
+    ax.set_xlabel('Juegos', fontsize=12)
+    ax.set_ylabel('Puntos', fontsize=12)
+    ax.set_title(f'Gráfica de Puntos vs Juegos - {player_name}', fontsize=14, fontweight='bold')
+
+    return figure_to_png(fig)
+
+
+def render_dispersion_analysis(team_data):
+    """Dibuja el análisis de dispersión de un equipo con Agg y lo devuelve como PNG."""
+    import numpy as np
+
+    fig, ((ax1, ax2), (ax3, ax4)) = reusable_figure((15, 10), 2, 2)
+    
+    # Una sola conversión a arreglo contiguo, reutilizado por las cuatro gráficas
+    scores = np.ascontiguousarray(team_data['scores'], dtype=np.float64)
+    team_name = team_data['name']
+    avg = team_data['average_score']
+    std = team_data['std_deviation']
+    
+    # Gráfica 1: Histograma de distribución de puntajes (binado con NumPy, dibujado como barras)
+    counts, edges = np.histogram(scores, bins=30)
+    ax1.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color='skyblue', edgecolor='black')
+    ax1.axvline(avg, color='red', linestyle='--', linewidth=2, label=f'Promedio: {avg}')
+    ax1.axvline(avg + std, color='orange', linestyle='--', alpha=0.7, label=f'+1 Desv: {avg + std:.2f}')
+    ax1.axvline(avg - std, color='orange', linestyle='--', alpha=0.7, label=f'-1 Desv: {avg - std:.2f}')
+    ax1.set_xlabel('Puntaje por Juego')
+    ax1.set_ylabel('Frecuencia')
+    ax1.set_title(f'Distribución de Puntajes - {team_name}')
+    ax1.legend()
+    
+    # Gráfica 2: Box plot para visualizar quartiles y outliers (estadísticas en O(n))
+    ax2.bxp([box_stats(scores)], patch_artist=True, 
+           boxprops=dict(facecolor='lightblue', alpha=0.7),
+           medianprops=dict(color='red', linewidth=2))
+    ax2.set_ylabel('Puntaje')
+    ax2.set_title(f'Box Plot - {team_name}')
+    
+    # Gráfica 3: Serie temporal de puntajes a lo largo de los juegos (reducida conservando
+    # el mínimo y el máximo de cada tramo)
+    idx = envelope_indices(scores, PLOT_MAX_POINTS)
+    games = idx + 1
+    ax3.plot(games, scores[idx], color='blue', alpha=0.6, linewidth=1)
+    ax3.axhline(avg, color='red', linestyle='--', label=f'Promedio: {avg}')
+    ax3.fill_between(games, avg - std, avg + std, alpha=0.2, color='orange', 
+                    label=f'±1 Desviación Estándar')
+    ax3.set_xlabel('Número de Juego')
+    ax3.set_ylabel('Puntaje')
+    ax3.set_title(f'Serie Temporal de Puntajes - {team_name}')
+    ax3.legend()
+    
+    # Gráfica 4: Q-Q Plot para evaluar normalidad de los datos (cuantiles vectorizados
+    # sobre una rejilla reducida de a lo sumo QQ_MAX_POINTS posiciones)
+    idx, standard_quantiles = std_normal_quantiles(scores.size)
+    sorted_scores = np.sort(scores)[idx]
+    normal_quantiles = avg + std * standard_quantiles
+    
+    ax4.scatter(normal_quantiles, sorted_scores, alpha=0.6, color='green')
+    
+    # Línea de referencia para distribución normal perfecta
+    min_val = min(normal_quantiles.min(), sorted_scores.min())
+    max_val = max(normal_quantiles.max(), sorted_scores.max())
+    ax4.plot([min_val, max_val], [min_val, max_val], 'r--', alpha=0.7)
+    
+    ax4.set_xlabel('Cuantiles Teóricos (Distribución Normal)')
+    ax4.set_ylabel('Cuantiles Observados')
+    ax4.set_title(f'Q-Q Plot vs Normal - {team_name}')
+    
+    fig.suptitle(f'Análisis de Dispersión - {team_name}', fontsize=16, fontweight='bold')
+
+    return figure_to_png(fig)
+
+
+def render_combined_dispersion_analysis(distribution_data):
+    """Dibuja el análisis comparativo de dispersión de ambos equipos con Agg y lo devuelve como PNG."""
+    import numpy as np
+
+    fig, ((ax1, ax2), (ax3, ax4)) = reusable_figure((15, 10), 2, 2)
+    
+    team_a_data = distribution_data['team_a']
+    team_b_data = distribution_data['team_b']
+    
+    # Una sola conversión a arreglo contiguo por equipo, reutilizada por todas las gráficas
+    scores_a = np.ascontiguousarray(team_a_data['scores'], dtype=np.float64)
+    scores_b = np.ascontiguousarray(team_b_data['scores'], dtype=np.float64)
+    
+    # Gráfica 1: Histogramas superpuestos para comparación directa (mismas 30 clases
+    # para ambos equipos, binadas con NumPy sobre el rango común)
+    value_range = (min(scores_a.min(), scores_b.min()), max(scores_a.max(), scores_b.max()))
+    density_a, edges = np.histogram(scores_a, bins=30, range=value_range, density=True)
+    density_b, _ = np.histogram(scores_b, bins=30, range=value_range, density=True)
+    width = np.diff(edges)
+    ax1.bar(edges[:-1], density_a, width=width, align='edge', alpha=0.6, color='blue', label='Team A')
+    ax1.bar(edges[:-1], density_b, width=width, align='edge', alpha=0.6, color='red', label='Team B')
+    ax1.axvline(team_a_data['average_score'], color='blue', linestyle='--', linewidth=2)
+    ax1.axvline(team_b_data['average_score'], color='red', linestyle='--', linewidth=2)
+    ax1.set_xlabel('Puntaje por Juego')
+    ax1.set_ylabel('Densidad')
+    ax1.set_title('Distribución Comparativa de Puntajes')
+    ax1.legend()
+    
+    # Gráfica 2: Box plots lado a lado (estadísticas en O(n), dibujadas con bxp)
+    # Cada caja se crea ya con su color (sin repintar los parches después)
+    ax2.bxp([box_stats(scores_a, 'Team A')], positions=[1], patch_artist=True,
+            boxprops=dict(facecolor='lightblue'))
+    ax2.bxp([box_stats(scores_b, 'Team B')], positions=[2], patch_artist=True,
+            boxprops=dict(facecolor='lightcoral'))
+    ax2.set_ylabel('Puntaje')
+    ax2.set_title('Box Plot Comparativo')
+    
+    # Gráfica 3: Series temporales comparativas (muestra equiespaciada de toda la corrida,
+    # no solo los primeros juegos)
+    sample_size = min(100, scores_a.size)
+    step = max(1, scores_a.size // sample_size)
+    games_sample = np.arange(1, scores_a.size + 1, step)[:sample_size]
+    sample_a = scores_a[::step][:sample_size]  # vistas con paso, sin copiar
+    sample_b = scores_b[::step][:sample_size]
+    ax3.plot(games_sample, sample_a, color='blue', alpha=0.7, label='Team A', linewidth=1)
+    ax3.plot(games_sample, sample_b, color='red', alpha=0.7, label='Team B', linewidth=1)
+    ax3.axhline(team_a_data['average_score'], color='blue', linestyle='--', alpha=0.7)
+    ax3.axhline(team_b_data['average_score'], color='red', linestyle='--', alpha=0.7)
+    ax3.set_xlabel(f'Número de Juego (muestra de {sample_size}, cada {step})')
+    ax3.set_ylabel('Puntaje')
+    ax3.set_title('Serie Temporal Comparativa (Muestra)')
+    ax3.legend()
+    
+    # Gráfica 4: Comparación de estadísticas en formato de barras
+    categories = ['Promedio', 'Desv. Estándar', 'Varianza']
+    stats = np.array([
+        [team_a_data['average_score'], team_a_data['std_deviation'], team_a_data['variance']],
+        [team_b_data['average_score'], team_b_data['std_deviation'], team_b_data['variance']],
+    ], dtype=np.float64)
+    
+    x = np.arange(len(categories))
+    width = 0.35
+    
+    bars_a = ax4.bar(x - width/2, stats[0], width, label='Team A', color='lightblue', alpha=0.8)
+    bars_b = ax4.bar(x + width/2, stats[1], width, label='Team B', color='lightcoral', alpha=0.8)
+    
+    ax4.set_xlabel('Estadísticas')
+    ax4.set_ylabel('Valor')
+    ax4.set_title('Comparación de Estadísticas Descriptivas')
+    ax4.set_xticks(x)
+    ax4.set_xticklabels(categories)
+    ax4.legend()
+    
+    # Añadir valores numéricos sobre las barras para mejor legibilidad
+    ax4.bar_label(bars_a, fmt='%.2f', padding=3, fontsize=9)
+    ax4.bar_label(bars_b, fmt='%.2f', padding=3, fontsize=9)
+    
+    fig.suptitle('Análisis Comparativo de Dispersión - Team A vs Team B', fontsize=16, fontweight='bold')
+
+    return figure_to_png(fig)
+
+
 class View(tk.Tk):
     """Vista principal de la aplicación - Interfaz gráfica del simulador de arquería."""
+
+    # Tamaño inicial de la ventana (se usa también para centrarla sin consultar a Tk)
+    WINDOW_WIDTH = 1000
+    WINDOW_HEIGHT = 700
+
+    # Periodo (ms) con el que la pantalla de carga revisa la cola de progreso
+    PROGRESS_POLL_MS = 33
+
+    # Frecuencia de refresco de la pantalla (Hz): tope de la animación de la barra de
+    # carga; se puede sobrescribir (en la clase o la instancia) para otros monitores
+    refresh_hz = 60
+
+    # Columnas de la grilla de botones de jugadores
+    PLAYER_COLUMNS = 5
+
+    # Filas (claves de format_results) de las tablas de velocidades y volumen de datos
+    METRIC_ROWS = {
+        "rates": ("games_per_second", "rounds_per_second", "shots_per_second", "luck_per_second"),
+        "volume": ("total_games", "total_rounds", "total_shots", "avg_shots_game", "avg_shots_round", "total_luck"),
+    }
     
     def __init__(self):
         super().__init__()
@@ -108,28 +447,63 @@ class View(tk.Tk):
         self.load_frame = None
         self.loading_bar = None
 
+        # Pantalla de resultados: se construye una vez y se reutiliza entre simulaciones
+        self._results_frame = None
+        self._results_widgets = {}
+        self._results = None
+
+        # Proceso dedicado para construir gráficas sin bloquear el hilo de Tk (se crea
+        # con la primera gráfica); las terminadas llegan por una cola y <<PlotReady>>
+        self._plot_executor = None
+        self._ready_plots = queue.Queue()
+        self.bind("<<PlotReady>>", self._on_plot_ready)
+
+        # Ventana de gráficas: se crea con la primera y se reutiliza para las siguientes
+        self._plot_window = None
+        self._plot_label = None
+
+        # La simulación corre en un hilo aparte que nunca toca widgets: deja los
+        # resultados en esta cola y avisa al bucle de Tk con <<SimDone>>
+        self._pending_results = queue.Queue()
+        self.bind("<<SimDone>>", self._on_sim_done)
+
+        # Progreso informado por el hilo de simulación: se encola y la pantalla de carga lo
+        # vacía con un único temporizador (~30 fps) que aplica solo el valor más reciente
+        self._progress_queue = queue.Queue()
+        self._progress_poll_id = None
+        self._in_progress = False
+
+        create_fonts(self)
+
         # Configuración de ventana sin barra de título nativa
         self.overrideredirect(True)
 
         # Configuración inicial de la ventana
         self.title("Simulador de Juegos de Arquería")
-        self.geometry("1000x700")
-        self.configure(bg="#f0f0f0")
-        self.update_idletasks()
+        self._bg = "#f0f0f0"
+        self.configure(bg=self._bg)
         
-        # Centrar ventana en pantalla
-        self.geometry("+{}+{}".format(
-            int(self.winfo_screenwidth()/2 - self.winfo_width()/2), 
-            int(self.winfo_screenheight()/2 - self.winfo_height()/2)
-        ))
+        # Tamaño y posición centrada en una sola llamada (sin forzar un pase de layout)
+        x = (self.winfo_screenwidth() - self.WINDOW_WIDTH) // 2
+        y = (self.winfo_screenheight() - self.WINDOW_HEIGHT) // 2
+        self.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}+{x}+{y}")
+
+        # Estilo de las tablas de resultados (ttk.Treeview)
+        style = ttk.Style(self)
+        style.configure("Results.Treeview", font=_FONTS["11"], rowheight=24)
+        style.configure("Results.Treeview.Heading", font=_FONTS["12_bold"])
 
         # Frame principal de la aplicación
-        self.main_frame = tk.Frame(self, bg=self.cget("bg"))
+        self.main_frame = tk.Frame(self, bg=self._bg)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Configuración para arrastrar ventana (compensar falta de barra de título)
         self._drag_offset_x = 0
         self._drag_offset_y = 0
+
+        # Posición pendiente del arrastre: se aplica una sola vez por ciclo ocioso de Tk
+        self._move_pending = None
+        self._move_scheduled = False
         
         def _start_move(event):
             try:
@@ -139,12 +513,10 @@ class View(tk.Tk):
                 pass
                 
         def _do_move(event):
-            try:
-                new_x = event.x_root - self._drag_offset_x
-                new_y = event.y_root - self._drag_offset_y
-                self.geometry(f"+{new_x}+{new_y}")
-            except Exception:
-                pass
+            self._move_pending = (event.x_root - self._drag_offset_x, event.y_root - self._drag_offset_y)
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                self.after_idle(self._apply_move)
         
         self.main_frame.bind("<ButtonPress-1>", _start_move)
         self.main_frame.bind("<B1-Motion>", _do_move)
@@ -153,16 +525,21 @@ class View(tk.Tk):
         self.bind("<Escape>", lambda e: self.destroy())
 
         # Título principal de la aplicación
-        self.label = tk.Label(self.main_frame, text="Simulador de juegos de arqueria", bg=self.cget("bg"))
-        self.label.config(font=("Arial", 20))
+        self.label = tk.Label(self.main_frame, text="Simulador de juegos de arqueria", bg=self._bg)
+        self.label.config(font=_FONTS["20"])
         self.label.pack(pady=(40, 20))
 
         # Contenedor para centrar el botón de inicio
-        button_container = tk.Frame(self.main_frame, bg=self.cget("bg"))
+        button_container = tk.Frame(self.main_frame, bg=self._bg)
         button_container.pack(expand=True)
 
         def on_start():
             """Maneja el inicio de la simulación en un hilo separado."""
+            # Una sola simulación a la vez: el botón queda deshabilitado hasta que termine
+            if self._in_progress:
+                return
+            self._in_progress = True
+            self.start_btn.config(state="disabled")
             self.show_load_frame()
             threading.Thread(target=self.presenter.start_simulation, daemon=True).start()
 
@@ -171,7 +548,7 @@ class View(tk.Tk):
             button_container,
             text="Iniciar Simulación",
             command=on_start,
-            font=("Arial", 16, "bold"),
+            font=_FONTS["16_bold"],
             width=24,
             height=2,
             bg="#2ecc71",
@@ -200,6 +577,15 @@ class View(tk.Tk):
         self.start_btn.bind("<Enter>", _on_enter)
         self.start_btn.bind("<Leave>", _on_leave)
 
+    def _apply_move(self):
+        """Mueve la ventana a la última posición de arrastre recibida."""
+        self._move_scheduled = False
+        try:
+            new_x, new_y = self._move_pending
+            self.geometry(f"+{new_x}+{new_y}")
+        except Exception:
+            pass
+
     def show_load_frame(self):
         """Muestra la pantalla de carga ocultando el frame principal."""
         self.main_frame.pack_forget()
@@ -208,25 +594,43 @@ class View(tk.Tk):
 
     def create_load_frame(self):
         """Crea y configura el frame de carga con barra de progreso."""
-        self.load_frame = tk.Frame(self, bg=self.cget("bg"))
-        self.load_frame.pack(fill=tk.BOTH, expand=True)
+        self.load_frame = tk.Frame(self, bg=self._bg)
         self.loading_bar = LoadingBar(self.load_frame)
         self.loading_bar.start_indeterminate()
+        self._stop_progress_polling()
+        self._poll_progress()
 
     def set_presenter(self, presenter):
         """Establece la referencia al presenter para comunicación MVP."""
         self.presenter = presenter
 
     def set_loading_progress(self, pct: int):
-        """Actualiza el progreso de carga desde el presenter."""
-        if self.loading_bar:
+        """Actualiza el progreso de carga desde el presenter (seguro desde otro hilo)."""
+        self._progress_queue.put_nowait(pct)
+
+    def _poll_progress(self):
+        """Aplica el progreso más reciente de la cola y vuelve a programarse (hilo de Tk)."""
+        latest = None
+        while True:
             try:
-                self.after(0, lambda: self.loading_bar.set_progress(pct))
-            except Exception:
-                pass
+                latest = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None and self.loading_bar:
+            self.loading_bar.set_progress(latest)
+        self._progress_poll_id = self.after(self.PROGRESS_POLL_MS, self._poll_progress)
+
+    def _stop_progress_polling(self):
+        """Cancela el temporizador de progreso de la pantalla de carga."""
+        if self._progress_poll_id is not None:
+            self.after_cancel(self._progress_poll_id)
+            self._progress_poll_id = None
 
     def simulation_finished(self, results: dict):
-        """Maneja la finalización de la simulación y muestra resultados."""
+        """Maneja la finalización de la simulación y muestra resultados (hilo de Tk)."""
+        self._stop_progress_polling()
+        self._in_progress = False
+        self.start_btn.config(state="normal")
         # Detener barra de progreso
         if self.loading_bar:
             try:
@@ -234,452 +638,381 @@ class View(tk.Tk):
             except Exception:
                 pass
         
-        # Mostrar resultados en el hilo principal de UI
+        # Todo el árbol de widgets se arma en un único callback ocioso: Tk no pinta
+        # estados parciales mientras se construye la pantalla de resultados
+        self.after_idle(self.build_results, results)
+
+    def show_results(self, results):
+        """Recibe los resultados desde el hilo de simulación y avisa al hilo de Tk."""
+        self._pending_results.put(results)
         try:
-            self.after(50, lambda: self.show_results(results))
+            self.event_generate("<<SimDone>>", when="tail")
         except Exception:
-            self.show_results(results)
+            pass  # La ventana ya se cerró
 
-    def show_results(self, results):
-        """Muestra la pantalla de resultados con toda la información de la simulación."""
-        # Configuración inicial del frame de resultados con scroll
-        results_frame = tk.Frame(self)
-        canvas = tk.Canvas(results_frame)
-        scrollbar = tk.Scrollbar(results_frame, orient=tk.VERTICAL, command=canvas.yview, width=10)
-        scrollable_frame = tk.Frame(canvas, border=2, relief="sunken")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        scrollable_frame_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", width=self.winfo_width() - 10)
+    def _on_sim_done(self, _event):
+        """Entrega al hilo de Tk los resultados de las simulaciones terminadas."""
+        while True:
+            try:
+                results = self._pending_results.get_nowait()
+            except queue.Empty:
+                return
+            self.simulation_finished(results)
+
+    def build_results(self, results):
+        """Muestra la pantalla de resultados; los widgets se crean solo la primera vez."""
+        # Crear widgets en Tk es caro y modificarlos es barato: la pantalla se arma una
+        # única vez y cada simulación posterior solo vuelca sus datos en ella
+        if self._results_frame is None:
+            self.create_results_screen()
+        self.update_results(results)
         
+        # Limpiar frame de carga si existe
+        try:
+            if self.load_frame:
+                if self.loading_bar:
+                    self.loading_bar.destroy()
+                self.load_frame.pack_forget()
+                self.load_frame.destroy()
+                self.load_frame = None
+                self.loading_bar = None
+        except Exception:
+            pass
+
+        self._results_widgets["notebook"].select(0)
+        self._results_frame.pack(fill=tk.BOTH, expand=True)
+
+    def create_results_screen(self):
+        """Construye la estructura fija de la pantalla de resultados (sin datos)."""
+        widgets = self._results_widgets
+
+        results_frame = tk.Frame(self)
+
         # Título principal de resultados
-        tk.Label(scrollable_frame, text="Resultados de la Simulación", font=("Arial", 20, "bold")).pack(pady=15)
+        tk.Label(results_frame, text="Resultados de la Simulación", font=_FONTS["20_bold"]).pack(pady=15)
+
+        # Botón para volver al menú principal (la pantalla se oculta, no se destruye);
+        # se empaca antes que las pestañas para que siempre conserve su espacio
+        tk.Button(results_frame, text="Volver", command=lambda: self.reset_view(results_frame)).pack(side=tk.BOTTOM, pady=10)
+
+        # Una pestaña por sección: Tk solo dibuja los widgets de la pestaña visible y no
+        # hace falta desplazamiento ni recalcular anchos al redimensionar
+        notebook = ttk.Notebook(results_frame)
+        notebook.pack(fill=tk.BOTH, expand=True, padx=10)
+        widgets["notebook"] = notebook
         
+        def add_tab(tab_title, section_title):
+            tab = tk.Frame(notebook)
+            notebook.add(tab, text=tab_title)
+            section = tk.LabelFrame(tab, text=section_title, font=_FONTS["14_bold"])
+            section.pack(fill=tk.X, padx=10, pady=10)
+            return section
+
         # === SECCIÓN: MÉTRICAS BÁSICAS ===
-        basic_frame = tk.LabelFrame(scrollable_frame, text="Métricas Básicas", font=("Arial", 14, "bold"))
-        basic_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        grid_frame = tk.Frame(basic_frame)
-        grid_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Información de métricas básicas en formato grid
-        tk.Label(grid_frame, text="Jugador con más suerte por juego:", font=("Arial", 12)).grid(row=0, column=0, sticky="w", padx=(0,10))
-        tk.Label(grid_frame, text=f"{results['luckiest_player_per_game']['player'].name} - {results['luckiest_player_per_game']['amount_luck']} veces", 
-                 font=("Arial", 12)).grid(row=0, column=1, sticky="w")
-        
-        tk.Label(grid_frame, text="Jugador con más experiencia:", font=("Arial", 12)).grid(row=1, column=0, sticky="w", padx=(0,10))
-        tk.Label(grid_frame, text=f"{results['more_experienced_player']['player'].name} - {results['more_experienced_player']['amount_experienced']} puntos", 
-                 font=("Arial", 12)).grid(row=1, column=1, sticky="w")
+        basic_frame = add_tab("Métricas", "Métricas Básicas")
         
-        tk.Label(grid_frame, text="Género más ganador por juego:", font=("Arial", 12)).grid(row=2, column=0, sticky="w", padx=(0,10))
-        tk.Label(grid_frame, text=f"{results['winner_gender_per_game']['gender']} - {results['winner_gender_per_game']['amount_wins']} veces", 
-                 font=("Arial", 12)).grid(row=2, column=1, sticky="w")
-        
-        tk.Label(grid_frame, text="Género más ganador en total:", font=("Arial", 12)).grid(row=3, column=0, sticky="w", padx=(0,10))
-        tk.Label(grid_frame, text=f"{results['winner_gender_total']['gender']} - {results['winner_gender_total']['total_rounds_won']} rondas", 
-                 font=("Arial", 12)).grid(row=3, column=1, sticky="w")
+        # Información de métricas básicas en una sola tabla
+        widgets["basic"] = self.create_table(basic_frame, ("Métrica", "Resultado"), 4)
+        widgets["basic"].pack(fill=tk.X, padx=10, pady=5)
 
         # === SECCIÓN: EQUIPO GANADOR ===
-        team_frame = tk.LabelFrame(scrollable_frame, text="Equipo Ganador", font=("Arial", 14, "bold"))
-        team_frame.pack(fill=tk.X, padx=10, pady=10)
+        team_frame = add_tab("Equipo", "Equipo Ganador")
         
-        tk.Label(team_frame, text=f"Equipo ganador: {results['winner_team_total']['team'].name}", 
-                 font=("Arial", 13, "bold")).pack(pady=5)
+        widgets["winner_team"] = tk.Label(team_frame, font=_FONTS["13_bold"])
+        widgets["winner_team"].pack(pady=5)
         
-        # Lista de jugadores del equipo ganador con sus puntos
-        for player_points in results['winner_team_total']['player_points']:
-            tk.Label(team_frame, text=f"• {player_points['player']} - {player_points['points']} puntos", 
-                     font=("Arial", 11)).pack(pady=2)
+        # Lista de jugadores del equipo ganador con sus puntos (una línea por jugador)
+        widgets["winner_players"] = tk.Label(team_frame, font=_FONTS["11"], justify="center")
+        widgets["winner_players"].pack(pady=2)
 
         # === SECCIÓN: DISTRIBUCIÓN DE PUNTAJES POR EQUIPO ===
-        distribution_frame = tk.LabelFrame(scrollable_frame, text="Distribución de Puntajes por Equipo", font=("Arial", 14, "bold"))
-        distribution_frame.pack(fill=tk.X, padx=10, pady=10)
+        distribution_frame = add_tab("Distribución", "Distribución de Puntajes por Equipo")
         
-        dist_grid = tk.Frame(distribution_frame)
-        dist_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        tk.Label(distribution_frame, text="Selecciona un equipo para ver su gráfica de dispersión:",
+                 font=_FONTS["11"]).pack(pady=(5, 0))
         
-        # Encabezados de la tabla de distribución
-        tk.Label(dist_grid, text="Equipo", font=("Arial", 12, "bold")).grid(row=0, column=0, padx=5, pady=2, sticky="w")
-        tk.Label(dist_grid, text="Promedio", font=("Arial", 12, "bold")).grid(row=0, column=1, padx=5, pady=2)
-        tk.Label(dist_grid, text="Varianza", font=("Arial", 12, "bold")).grid(row=0, column=2, padx=5, pady=2)
-        tk.Label(dist_grid, text="Desv. Estándar", font=("Arial", 12, "bold")).grid(row=0, column=3, padx=5, pady=2)
-        tk.Label(dist_grid, text="Ver Dispersión", font=("Arial", 12, "bold")).grid(row=0, column=4, padx=5, pady=2)
+        # Una fila por equipo; al seleccionarla se abre su análisis de dispersión
+        team_keys = ("team_a", "team_b")
+        dist_table = self.create_table(distribution_frame, ("Equipo", "Promedio", "Varianza", "Desv. Estándar"),
+                                       len(team_keys), selectmode="browse")
+        dist_table.pack(fill=tk.X, padx=10, pady=5)
+        widgets["distribution"] = dist_table
         
-        # Datos del Equipo A
-        team_a_data = results['team_score_distribution']['team_a']
-        tk.Label(dist_grid, text=team_a_data['name'], font=("Arial", 11)).grid(row=1, column=0, padx=5, pady=2, sticky="w")
-        tk.Label(dist_grid, text=f"{team_a_data['average_score']}", font=("Arial", 11)).grid(row=1, column=1, padx=5, pady=2)
-        tk.Label(dist_grid, text=f"{team_a_data['variance']}", font=("Arial", 11)).grid(row=1, column=2, padx=5, pady=2)
-        tk.Label(dist_grid, text=f"{team_a_data['std_deviation']}", font=("Arial", 11)).grid(row=1, column=3, padx=5, pady=2)
-        tk.Button(dist_grid, text="Gráfica", font=("Arial", 10), 
-                 command=lambda: self.show_dispersion_analysis(team_a_data)).grid(row=1, column=4, padx=5, pady=2)
+        def on_team_selected(_event):
+            selection = dist_table.selection()
+            if not selection:
+                return
+            team_key = team_keys[dist_table.index(selection[0])]
+            # Limpiar la selección para que volver a elegir el mismo equipo también funcione
+            dist_table.selection_remove(selection)
+            self.show_dispersion_analysis(self._results['team_score_distribution'][team_key])
         
-        # Datos del Equipo B
-        team_b_data = results['team_score_distribution']['team_b']
-        tk.Label(dist_grid, text=team_b_data['name'], font=("Arial", 11)).grid(row=2, column=0, padx=5, pady=2, sticky="w")
-        tk.Label(dist_grid, text=f"{team_b_data['average_score']}", font=("Arial", 11)).grid(row=2, column=1, padx=5, pady=2)
-        tk.Label(dist_grid, text=f"{team_b_data['variance']}", font=("Arial", 11)).grid(row=2, column=2, padx=5, pady=2)
-        tk.Label(dist_grid, text=f"{team_b_data['std_deviation']}", font=("Arial", 11)).grid(row=2, column=3, padx=5, pady=2)
-        tk.Button(dist_grid, text="Gráfica", font=("Arial", 10), 
-                 command=lambda: self.show_dispersion_analysis(team_b_data)).grid(row=2, column=4, padx=5, pady=2)
+        dist_table.bind("<<TreeviewSelect>>", on_team_selected)
         
         # Botón para comparación de ambos equipos
-        tk.Button(distribution_frame, text="Ver Comparación de Dispersión de Ambos Equipos", font=("Arial", 12), 
-                 command=lambda: self.show_combined_dispersion_analysis(results['team_score_distribution'])).pack(pady=10)
+        tk.Button(distribution_frame, text="Ver Comparación de Dispersión de Ambos Equipos", font=_FONTS["12"], 
+                 command=lambda: self.show_combined_dispersion_analysis(self._results['team_score_distribution'])).pack(pady=10)
 
         # === SECCIÓN: ANÁLISIS DE LANZAMIENTOS ESPECIALES ===
-        special_frame = tk.LabelFrame(scrollable_frame, text="Análisis de Lanzamientos Especiales", font=("Arial", 14, "bold"))
-        special_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        special_grid = tk.Frame(special_frame)
-        special_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # Encabezados para lanzamientos especiales
-        tk.Label(special_grid, text="Equipo", font=("Arial", 12, "bold")).grid(row=0, column=0, padx=5, pady=2, sticky="w")
-        tk.Label(special_grid, text="Total Especiales", font=("Arial", 12, "bold")).grid(row=0, column=1, padx=5, pady=2)
-        tk.Label(special_grid, text="Promedio/Juego", font=("Arial", 12, "bold")).grid(row=0, column=2, padx=5, pady=2)
-        tk.Label(special_grid, text="Experiencia Ganada", font=("Arial", 12, "bold")).grid(row=0, column=3, padx=5, pady=2)
-        tk.Label(special_grid, text="Factor Correlación", font=("Arial", 12, "bold")).grid(row=0, column=4, padx=5, pady=2)
+        special_frame = add_tab("Especiales", "Análisis de Lanzamientos Especiales")
         
         # Datos de lanzamientos especiales para ambos equipos
-        special_a = results['special_shots_analysis']['team_a']
-        tk.Label(special_grid, text=special_a['name'], font=("Arial", 11)).grid(row=1, column=0, padx=5, pady=2, sticky="w")
-        tk.Label(special_grid, text=f"{special_a['total_special_shots']}", font=("Arial", 11)).grid(row=1, column=1, padx=5, pady=2)
-        tk.Label(special_grid, text=f"{special_a['avg_special_shots_per_game']}", font=("Arial", 11)).grid(row=1, column=2, padx=5, pady=2)
-        tk.Label(special_grid, text=f"{special_a['experience_gained']}", font=("Arial", 11)).grid(row=1, column=3, padx=5, pady=2)
-        tk.Label(special_grid, text=f"{special_a['correlation_factor']}", font=("Arial", 11)).grid(row=1, column=4, padx=5, pady=2)
-        
-        special_b = results['special_shots_analysis']['team_b']
-        tk.Label(special_grid, text=special_b['name'], font=("Arial", 11)).grid(row=2, column=0, padx=5, pady=2, sticky="w")
-        tk.Label(special_grid, text=f"{special_b['total_special_shots']}", font=("Arial", 11)).grid(row=2, column=1, padx=5, pady=2)
-        tk.Label(special_grid, text=f"{special_b['avg_special_shots_per_game']}", font=("Arial", 11)).grid(row=2, column=2, padx=5, pady=2)
-        tk.Label(special_grid, text=f"{special_b['experience_gained']}", font=("Arial", 11)).grid(row=2, column=3, padx=5, pady=2)
-        tk.Label(special_grid, text=f"{special_b['correlation_factor']}", font=("Arial", 11)).grid(row=2, column=4, padx=5, pady=2)
+        widgets["special"] = self.create_table(
+            special_frame, ("Equipo", "Total Especiales", "Promedio/Juego", "Experiencia Ganada", "Factor Correlación"), 2)
+        widgets["special"].pack(fill=tk.X, padx=10, pady=5)
 
         # === SECCIÓN: ANÁLISIS DE RONDAS EMPATADAS ===
-        tied_frame = tk.LabelFrame(scrollable_frame, text="Análisis de Rondas Empatadas", font=("Arial", 14, "bold"))
-        tied_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        tied_data = results['tied_rounds_analysis']
-        tied_info_frame = tk.Frame(tied_frame)
-        tied_info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        tied_frame = add_tab("Empates", "Análisis de Rondas Empatadas")
         
         # Estadísticas de rondas empatadas
-        tk.Label(tied_info_frame, text=f"Total de rondas jugadas: {tied_data['total_rounds']}", 
-                 font=("Arial", 12)).pack(anchor="w", pady=2)
-        tk.Label(tied_info_frame, text=f"Rondas empatadas: {tied_data['tied_rounds_count']} ({tied_data['tied_frequency_percent']}%)", 
-                 font=("Arial", 12)).pack(anchor="w", pady=2)
-        tk.Label(tied_info_frame, text=f"Rondas con ganador: {tied_data['non_tied_rounds']} ({tied_data['non_tied_frequency_percent']}%)", 
-                 font=("Arial", 12)).pack(anchor="w", pady=2)
+        widgets["tied"] = self.create_text_block(tied_frame, 3)
+        widgets["tied"].pack(fill=tk.X, padx=10, pady=5)
 
         # === SECCIÓN: MÉTRICAS DE EFICIENCIA Y RENDIMIENTO ===
-        efficiency_frame = tk.LabelFrame(scrollable_frame, text="Tiempo Total de Simulación y Eficiencia del Sistema", font=("Arial", 14, "bold"))
-        efficiency_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        efficiency_data = results['efficiency_metrics']
+        # Repartida en dos pestañas: la ventana es fija (1000x700) y las cuatro subsecciones
+        # juntas no caben en el alto disponible para el cuaderno
+        efficiency_frame = add_tab("Tiempos", "Tiempo Total de Simulación y Eficiencia del Sistema")
         
         # Subsección: Tiempos de ejecución
-        timing_frame = tk.LabelFrame(efficiency_frame, text="Tiempos de Ejecución", font=("Arial", 12, "bold"))
+        timing_frame = tk.LabelFrame(efficiency_frame, text="Tiempos de Ejecución", font=_FONTS["12_bold"])
         timing_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        timing_grid = tk.Frame(timing_frame)
-        timing_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        tk.Label(timing_grid, text=f"Tiempo Total: {efficiency_data['timing']['total_time_seconds']}s ({efficiency_data['timing']['total_time_minutes']} min)", 
-                 font=("Arial", 12, "bold")).pack(anchor="w", pady=2)
-        tk.Label(timing_grid, text=f"• Configuración inicial: {efficiency_data['timing']['setup_time_seconds']}s ({efficiency_data['time_distribution']['setup_percentage']}%)", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(timing_grid, text=f"• Generación de juegos: {efficiency_data['timing']['games_generation_time_seconds']}s ({efficiency_data['time_distribution']['games_generation_percentage']}%)", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(timing_grid, text=f"• Análisis de resultados: {efficiency_data['timing']['analysis_time_seconds']}s ({efficiency_data['time_distribution']['analysis_percentage']}%)", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        
-        # Subsección: Velocidades de procesamiento
-        performance_frame = tk.LabelFrame(efficiency_frame, text="Velocidades de Procesamiento", font=("Arial", 12, "bold"))
-        performance_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        perf_grid = tk.Frame(performance_frame)
-        perf_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # División en dos columnas para mejor organización visual
-        perf_left = tk.Frame(perf_grid)
-        perf_left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        tk.Label(perf_left, text=f"Juegos por segundo: {efficiency_data['processing_rates']['games_per_second']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(perf_left, text=f"Rondas por segundo: {efficiency_data['processing_rates']['rounds_per_second']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        
-        perf_right = tk.Frame(perf_grid)
-        perf_right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        tk.Label(perf_right, text=f"Disparos por segundo: {efficiency_data['processing_rates']['shots_per_second']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(perf_right, text=f"Cálculos de suerte/seg: {efficiency_data['processing_rates']['luck_calculations_per_second']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        
-        # Subsección: Volumen de datos procesados
-        data_frame = tk.LabelFrame(efficiency_frame, text="Volumen de Datos Procesados", font=("Arial", 12, "bold"))
-        data_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        data_grid = tk.Frame(data_frame)
-        data_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # División en dos columnas
-        data_left = tk.Frame(data_grid)
-        data_left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        tk.Label(data_left, text=f"Total de juegos: {efficiency_data['data_volume']['total_games']:,}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(data_left, text=f"Total de rondas: {efficiency_data['data_volume']['total_rounds']:,}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(data_left, text=f"Total de disparos: {efficiency_data['data_volume']['total_shots']:,}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        
-        data_right = tk.Frame(data_grid)
-        data_right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        tk.Label(data_right, text=f"Disparos promedio/juego: {efficiency_data['data_volume']['average_shots_per_game']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(data_right, text=f"Disparos promedio/ronda: {efficiency_data['data_volume']['average_shots_per_round']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(data_right, text=f"Cálculos de suerte: {efficiency_data['data_volume']['total_luck_calculations']:,}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
+        widgets["timing"] = self.create_text_block(timing_frame, 4)
+        widgets["timing"].pack(fill=tk.X, padx=10, pady=5)
         
         # Subsección: Indicadores de rendimiento del sistema
-        system_frame = tk.LabelFrame(efficiency_frame, text="Indicadores de Rendimiento del Sistema", font=("Arial", 12, "bold"))
+        system_frame = tk.LabelFrame(efficiency_frame, text="Indicadores de Rendimiento del Sistema", font=_FONTS["12_bold"])
         system_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        system_grid = tk.Frame(system_frame)
-        system_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        tk.Label(system_grid, text=f"Puntuación de rendimiento: {efficiency_data['system_performance']['throughput_score']} operaciones/segundo", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(system_grid, text=f"Ratio de eficiencia: {efficiency_data['system_performance']['efficiency_ratio']} (0-1)", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-        tk.Label(system_grid, text=f"Intensidad de procesamiento: {efficiency_data['system_performance']['processing_intensity']}", 
-                 font=("Arial", 11)).pack(anchor="w", pady=1)
-
-        # === SECCIÓN: GRÁFICAS POR JUGADOR ===
-        graphics_frame = tk.LabelFrame(scrollable_frame, text="Gráficas de Puntos vs Juegos por Jugador", font=("Arial", 14, "bold"))
-        graphics_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        tk.Label(graphics_frame, text="Haz clic en un jugador para ver su gráfica:", font=("Arial", 12)).pack(pady=5)
-        
-        # Grid de botones para cada jugador (máximo 5 columnas)
-        grid2_frame = tk.Frame(graphics_frame)
-        grid2_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        row, column = 0, 0
-        for player_vs_game in results['points_vs_games_per_player']:
-            data = {"points": player_vs_game['points']}
-            tk.Button(grid2_frame, text=f"{player_vs_game['player'].name}", 
-                command=lambda data=data, name=player_vs_game['player'].name: self.show_graphics(data, name)).grid(row=row, column=column, padx=2, pady=2)
-            column += 1
-            if column == 5:  # Máximo 5 columnas por fila
-                row += 1
-                column = 0
-
-        # Configuración del scroll para el contenido dinámico
-        def on_configure(_):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(scrollable_frame_id, width=self.winfo_width() - 10)
+        widgets["system"] = self.create_text_block(system_frame, 3)
+        widgets["system"].pack(fill=tk.X, padx=10, pady=5)
         
-        scrollable_frame.bind("<Configure>", on_configure)
-        canvas.bind("<Configure>", on_configure)
+        # Subsecciones tabulares: velocidades de procesamiento y volumen de datos
+        performance_frame = add_tab("Rendimiento", "Rendimiento del Procesamiento")
         
-        # Botón para volver al menú principal
-        def on_back():
-            self.reset_view(results_frame)
-            results_frame.destroy()
-        
-        tk.Button(results_frame, text="Volver", command=on_back).pack(pady=10)
-        
-        # Limpiar frame de carga si existe
-        try:
-            if self.load_frame:
-                self.load_frame.pack_forget()
-                self.load_frame.destroy()
-                self.load_frame = None
-                self.loading_bar = None
-        except Exception:
-            pass
+        for key, title in (("rates", "Velocidades de Procesamiento"), ("volume", "Volumen de Datos Procesados")):
+            section_frame = tk.LabelFrame(performance_frame, text=title, font=_FONTS["12_bold"])
+            section_frame.pack(fill=tk.X, padx=5, pady=5)
+            widgets[key] = self.create_table(section_frame, ("Métrica", "Valor"), len(self.METRIC_ROWS[key]))
+            widgets[key].pack(fill=tk.X, padx=10, pady=5)
 
-        results_frame.pack(fill=tk.BOTH, expand=True)
+        # === SECCIÓN: GRÁFICAS POR JUGADOR ===
+        graphics_frame = add_tab("Gráficas", "Gráficas de Puntos vs Juegos por Jugador")
+        
+        tk.Label(graphics_frame, text="Haz clic en un jugador para ver su gráfica:", font=_FONTS["12"]).pack(pady=5)
+        
+        # Grid de botones para cada jugador (se llena en update_results)
+        widgets["players_grid"] = tk.Frame(graphics_frame)
+        widgets["players_grid"].pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        widgets["player_buttons"] = []
+
+        self._results_frame = results_frame
+
+    def update_results(self, results):
+        """Vuelca los datos de una simulación en la pantalla de resultados ya construida."""
+        self._results = results
+        widgets = self._results_widgets
+        
+        # Todos los textos se formatean en una sola pasada antes de tocar widgets
+        text = self.format_results(results)
+
+        self.set_table_rows(widgets["basic"], [
+            ("Jugador con más suerte por juego:", text["luckiest"]),
+            ("Jugador con más experiencia:", text["most_experienced"]),
+            ("Género más ganador por juego:", text["gender_per_game"]),
+            ("Género más ganador en total:", text["gender_total"]),
+        ])
+        widgets["winner_team"].config(text=text["winner_team"])
+        widgets["winner_players"].config(text="\n".join(text["winner_players"]))
+        self.set_table_rows(widgets["distribution"], [text["team_a_distribution"], text["team_b_distribution"]])
+        self.set_table_rows(widgets["special"], text["special_rows"])
+        self.set_text_block(widgets["tied"], [
+            (text["tied_total"], "body"),
+            (text["tied_count"], "body"),
+            (text["tied_non"], "body"),
+        ])
+        self.set_text_block(widgets["timing"], [
+            (text["time_total"], "bold"),
+            (text["time_setup"], "small"),
+            (text["time_games"], "small"),
+            (text["time_analysis"], "small"),
+        ])
+        for key, row_keys in self.METRIC_ROWS.items():
+            self.set_table_rows(widgets[key], [text[row_key] for row_key in row_keys])
+        self.set_text_block(widgets["system"], [
+            (text["throughput"], "small"),
+            (text["efficiency_ratio"], "small"),
+            (text["intensity"], "small"),
+        ])
+
+        # Botones de jugadores: se reutilizan los existentes y solo se crean los que falten
+        buttons = widgets["player_buttons"]
+        players = results['points_vs_games_per_player']
+        for index, player_vs_game in enumerate(players):
+            name = player_vs_game['player'].name
+            command = partial(self.show_graphics, player_vs_game['points'], name)
+            if index < len(buttons):
+                buttons[index].config(text=name, command=command)
+            else:
+                row, column = divmod(index, self.PLAYER_COLUMNS)
+                button = tk.Button(widgets["players_grid"], text=name, command=command)
+                button.grid(row=row, column=column, padx=2, pady=2)
+                buttons.append(button)
+        for button in buttons[len(players):]:
+            button.destroy()
+        del buttons[len(players):]
+
+    def format_results(self, results):
+        """Formatea en una sola pasada todos los textos de la pantalla de resultados."""
+        luckiest = results['luckiest_player_per_game']
+        experienced = results['more_experienced_player']
+        gender_game = results['winner_gender_per_game']
+        gender_total = results['winner_gender_total']
+        winner_team = results['winner_team_total']
+        tied = results['tied_rounds_analysis']
+        efficiency = results['efficiency_metrics']
+        timing = efficiency['timing']
+        distribution = efficiency['time_distribution']
+        rates = efficiency['processing_rates']
+        volume = efficiency['data_volume']
+        system = efficiency['system_performance']
+
+        text = {
+            "luckiest": f"{luckiest['player'].name} - {luckiest['amount_luck']} veces",
+            "most_experienced": f"{experienced['player'].name} - {experienced['amount_experienced']} puntos",
+            "gender_per_game": f"{gender_game['gender']} - {gender_game['amount_wins']} veces",
+            "gender_total": f"{gender_total['gender']} - {gender_total['total_rounds_won']} rondas",
+            "winner_team": f"Equipo ganador: {winner_team['team'].name}",
+            "winner_players": [f"• {player_points['player']} - {player_points['points']} puntos"
+                               for player_points in winner_team['player_points']],
+            "tied_total": f"Total de rondas jugadas: {tied['total_rounds']}",
+            "tied_count": f"Rondas empatadas: {tied['tied_rounds_count']} ({tied['tied_frequency_percent']}%)",
+            "tied_non": f"Rondas con ganador: {tied['non_tied_rounds']} ({tied['non_tied_frequency_percent']}%)",
+            "time_total": f"Tiempo Total: {timing['total_time_seconds']}s ({timing['total_time_minutes']} min)",
+            "time_setup": f"• Configuración inicial: {timing['setup_time_seconds']}s ({distribution['setup_percentage']}%)",
+            "time_games": f"• Generación de juegos: {timing['games_generation_time_seconds']}s ({distribution['games_generation_percentage']}%)",
+            "time_analysis": f"• Análisis de resultados: {timing['analysis_time_seconds']}s ({distribution['analysis_percentage']}%)",
+            "games_per_second": ("Juegos por segundo", f"{rates['games_per_second']}"),
+            "rounds_per_second": ("Rondas por segundo", f"{rates['rounds_per_second']}"),
+            "shots_per_second": ("Disparos por segundo", f"{rates['shots_per_second']}"),
+            "luck_per_second": ("Cálculos de suerte/seg", f"{rates['luck_calculations_per_second']}"),
+            "total_games": ("Total de juegos", f"{volume['total_games']:,}"),
+            "total_rounds": ("Total de rondas", f"{volume['total_rounds']:,}"),
+            "total_shots": ("Total de disparos", f"{volume['total_shots']:,}"),
+            "avg_shots_game": ("Disparos promedio/juego", f"{volume['average_shots_per_game']}"),
+            "avg_shots_round": ("Disparos promedio/ronda", f"{volume['average_shots_per_round']}"),
+            "total_luck": ("Cálculos de suerte", f"{volume['total_luck_calculations']:,}"),
+            "throughput": f"Puntuación de rendimiento: {system['throughput_score']} operaciones/segundo",
+            "efficiency_ratio": f"Ratio de eficiencia: {system['efficiency_ratio']} (0-1)",
+            "intensity": f"Intensidad de procesamiento: {system['processing_intensity']}",
+        }
+        for team_key in ("team_a", "team_b"):
+            team_data = results['team_score_distribution'][team_key]
+            text[f"{team_key}_distribution"] = (
+                team_data['name'], f"{team_data['average_score']}",
+                f"{team_data['variance']}", f"{team_data['std_deviation']}")
+        text["special_rows"] = [
+            (special['name'], special['total_special_shots'], special['avg_special_shots_per_game'],
+             special['experience_gained'], special['correlation_factor'])
+            for special in (results['special_shots_analysis']['team_a'], results['special_shots_analysis']['team_b'])
+        ]
+        return text
+
+    def create_table(self, parent, headings, height, selectmode="none"):
+        """Crea una tabla (un único ttk.Treeview) con los encabezados y la altura en filas indicados."""
+        columns = [f"col{i}" for i in range(len(headings))]
+        table = ttk.Treeview(parent, columns=columns, show="headings", height=height,
+                             selectmode=selectmode, style="Results.Treeview")
+        for column, heading in zip(columns, headings):
+            table.heading(column, text=heading)
+            table.column(column, anchor="center")
+        table.column(columns[0], anchor="w")
+        return table
+
+    def set_table_rows(self, table, rows):
+        """Reemplaza las filas de una tabla creada con create_table."""
+        table.delete(*table.get_children())
+        for row in rows:
+            table.insert("", "end", values=row)
+
+    def create_text_block(self, parent, height):
+        """Crea un bloque de texto de solo lectura con la altura en líneas indicada."""
+        # Tk mide `height` en líneas de la fuente propia del widget: se usa la más alta de
+        # las etiquetas para que ninguna línea quede cortada
+        text = tk.Text(parent, height=height, wrap="word", relief="flat", bd=0,
+                       font=_FONTS["12"], bg=parent.cget("bg"), cursor="arrow")
+        text.tag_configure("bold", font=_FONTS["12_bold"])
+        text.tag_configure("body", font=_FONTS["12"])
+        text.tag_configure("small", font=_FONTS["11"])
+        text.config(state="disabled")
+        return text
+
+    def set_text_block(self, text, lines):
+        """Reemplaza el contenido de un bloque de texto a partir de pares (texto, estilo)."""
+        text.config(state="normal")
+        text.delete("1.0", "end")
+        for index, (content, tag) in enumerate(lines):
+            text.insert("end", content if index == len(lines) - 1 else content + "\n", tag)
+        text.config(state="disabled")
 
     def reset_view(self, frame: tk.Frame):
         """Oculta el frame actual y restaura la vista principal."""
         frame.pack_forget()
         self.main_frame.pack(fill=tk.BOTH, expand=True)
     
-    def show_graphics(self, data, player_name):
-        """Muestra gráfica de puntos vs juegos para un jugador específico."""
-        plt.figure(figsize=(12, 8))
-        games = list(range(1, len(data['points']) + 1))
-        plt.plot(games, data['points'], color='blue', linewidth=2, alpha=0.7)
-        plt.scatter(games, data['points'], color='red', s=20, alpha=0.6)
-        plt.xlabel('Juegos', fontsize=12)
-        plt.ylabel('Puntos', fontsize=12)
-        plt.title(f'Gráfica de Puntos vs Juegos - {player_name}', fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.show()
+    def show_graphics(self, points, player_name):
+        """Muestra gráfica de puntos vs juegos para un jugador específico (renderizada en segundo plano)."""
+        self.submit_plot(f"Gráfica de Puntos vs Juegos - {player_name}", render_player_graphic, points, player_name)
+
+    def submit_plot(self, title, render, *args):
+        """Envía una función de renderizado al proceso de gráficas; el resultado se muestra al llegar <<PlotReady>>."""
+        if self._plot_executor is None:
+            # Import diferido: multiprocessing no se carga si nunca se pide una gráfica
+            from concurrent.futures import ProcessPoolExecutor
+            self._plot_executor = ProcessPoolExecutor(max_workers=1)
+        future = self._plot_executor.submit(render, *args)
+        future.add_done_callback(lambda done: self._plot_done(done, title))
+
+    def _plot_done(self, future, title):
+        """Encola la gráfica terminada y avisa al hilo de Tk (se ejecuta en un hilo del executor)."""
+        self._ready_plots.put((future, title))
+        try:
+            self.event_generate("<<PlotReady>>", when="tail")
+        except Exception:
+            pass  # La ventana ya se cerró
+
+    def _on_plot_ready(self, _event):
+        """Muestra todas las gráficas que terminaron de renderizarse."""
+        while True:
+            try:
+                future, title = self._ready_plots.get_nowait()
+            except queue.Empty:
+                return
+            self.show_plot_image(future.result(), title)
+
+    def show_plot_image(self, png_bytes, title):
+        """Muestra una gráfica ya renderizada en PNG en la ventana de gráficas (única y reutilizada)."""
+        if self._plot_window is None:
+            self._plot_window = tk.Toplevel(self)
+            # Cerrar la ventana solo la oculta: la siguiente gráfica la vuelve a mostrar
+            self._plot_window.protocol("WM_DELETE_WINDOW", self._plot_window.withdraw)
+            self._plot_label = tk.Label(self._plot_window)
+            self._plot_label.pack()
+        image = tk.PhotoImage(master=self._plot_window, data=base64.b64encode(png_bytes).decode("ascii"))
+        self._plot_label.config(image=image)
+        self._plot_label.image = image  # Mantener referencia (y soltar la anterior) para que Tk no libere la imagen
+        self._plot_window.title(title)
+        self._plot_window.deiconify()
+        self._plot_window.lift()
 
     def show_dispersion_analysis(self, team_data):
-        """Muestra análisis de dispersión detallado para un equipo específico."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-        
-        scores = team_data['scores']
-        team_name = team_data['name']
-        avg = team_data['average_score']
-        std = team_data['std_deviation']
-        
-        # Gráfica 1: Histograma de distribución de puntajes
-        ax1.hist(scores, bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-        ax1.axvline(avg, color='red', linestyle='--', linewidth=2, label=f'Promedio: {avg}')
-        ax1.axvline(avg + std, color='orange', linestyle='--', alpha=0.7, label=f'+1 Desv: {avg + std:.2f}')
-        ax1.axvline(avg - std, color='orange', linestyle='--', alpha=0.7, label=f'-1 Desv: {avg - std:.2f}')
-        ax1.set_xlabel('Puntaje por Juego')
-        ax1.set_ylabel('Frecuencia')
-        ax1.set_title(f'Distribución de Puntajes - {team_name}')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # Gráfica 2: Box plot para visualizar quartiles y outliers
-        ax2.boxplot(scores, patch_artist=True, 
-                   boxprops=dict(facecolor='lightblue', alpha=0.7),
-                   medianprops=dict(color='red', linewidth=2))
-        ax2.set_ylabel('Puntaje')
-        ax2.set_title(f'Box Plot - {team_name}')
-        ax2.grid(True, alpha=0.3)
-        
-        # Gráfica 3: Serie temporal de puntajes a lo largo de los juegos
-        games = list(range(1, len(scores) + 1))
-        ax3.plot(games, scores, color='blue', alpha=0.6, linewidth=1)
-        ax3.axhline(avg, color='red', linestyle='--', label=f'Promedio: {avg}')
-        ax3.fill_between(games, avg - std, avg + std, alpha=0.2, color='orange', 
-                        label=f'±1 Desviación Estándar')
-        ax3.set_xlabel('Número de Juego')
-        ax3.set_ylabel('Puntaje')
-        ax3.set_title(f'Serie Temporal de Puntajes - {team_name}')
-        ax3.legend()
-        ax3.grid(True, alpha=0.3)
-        
-        # Gráfica 4: Q-Q Plot para evaluar normalidad de los datos
-        sorted_scores = sorted(scores)
-        n = len(sorted_scores)
-        theoretical_quantiles = [(i - 0.5) / n for i in range(1, n + 1)]
-        
-        import math
-        normal_quantiles = [avg + std * math.sqrt(2) * self.inverse_erf(2 * q - 1) for q in theoretical_quantiles]
-        
-        ax4.scatter(normal_quantiles, sorted_scores, alpha=0.6, color='green')
-        
-        # Línea de referencia para distribución normal perfecta
-        min_val = min(min(normal_quantiles), min(sorted_scores))
-        max_val = max(max(normal_quantiles), max(sorted_scores))
-        ax4.plot([min_val, max_val], [min_val, max_val], 'r--', alpha=0.7)
-        
-        ax4.set_xlabel('Cuantiles Teóricos (Distribución Normal)')
-        ax4.set_ylabel('Cuantiles Observados')
-        ax4.set_title(f'Q-Q Plot vs Normal - {team_name}')
-        ax4.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.suptitle(f'Análisis de Dispersión - {team_name}', fontsize=16, fontweight='bold', y=1.02)
-        plt.show()
+        """Muestra análisis de dispersión detallado para un equipo específico (renderizado en segundo plano)."""
+        self.submit_plot(f"Análisis de Dispersión - {team_data['name']}", render_dispersion_analysis, team_data)
 
     def show_combined_dispersion_analysis(self, distribution_data):
-        """Muestra análisis comparativo de dispersión entre ambos equipos."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-        
-        team_a_data = distribution_data['team_a']
-        team_b_data = distribution_data['team_b']
-        
-        scores_a = team_a_data['scores']
-        scores_b = team_b_data['scores']
-        
-        # Gráfica 1: Histogramas superpuestos para comparación directa
-        ax1.hist(scores_a, bins=30, alpha=0.6, color='blue', label='Team A', density=True)
-        ax1.hist(scores_b, bins=30, alpha=0.6, color='red', label='Team B', density=True)
-        ax1.axvline(team_a_data['average_score'], color='blue', linestyle='--', linewidth=2)
-        ax1.axvline(team_b_data['average_score'], color='red', linestyle='--', linewidth=2)
-        ax1.set_xlabel('Puntaje por Juego')
-        ax1.set_ylabel('Densidad')
-        ax1.set_title('Distribución Comparativa de Puntajes')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # Gráfica 2: Box plots lado a lado
-        box_data = [scores_a, scores_b]
-        box_labels = ['Team A', 'Team B']
-        bp = ax2.boxplot(box_data, labels=box_labels, patch_artist=True)
-        bp['boxes'][0].set_facecolor('lightblue')
-        bp['boxes'][1].set_facecolor('lightcoral')
-        ax2.set_ylabel('Puntaje')
-        ax2.set_title('Box Plot Comparativo')
-        ax2.grid(True, alpha=0.3)
-        
-        # Gráfica 3: Series temporales comparativas (muestra para mejor visualización)
-        sample_size = min(100, len(scores_a))
-        games_sample = list(range(1, sample_size + 1))
-        ax3.plot(games_sample, scores_a[:sample_size], color='blue', alpha=0.7, label='Team A', linewidth=1)
-        ax3.plot(games_sample, scores_b[:sample_size], color='red', alpha=0.7, label='Team B', linewidth=1)
-        ax3.axhline(team_a_data['average_score'], color='blue', linestyle='--', alpha=0.7)
-        ax3.axhline(team_b_data['average_score'], color='red', linestyle='--', alpha=0.7)
-        ax3.set_xlabel(f'Número de Juego (primeros {sample_size})')
-        ax3.set_ylabel('Puntaje')
-        ax3.set_title('Serie Temporal Comparativa (Muestra)')
-        ax3.legend()
-        ax3.grid(True, alpha=0.3)
-        
-        # Gráfica 4: Comparación de estadísticas en formato de barras
-        categories = ['Promedio', 'Desv. Estándar', 'Varianza']
-        team_a_stats = [team_a_data['average_score'], team_a_data['std_deviation'], team_a_data['variance']]
-        team_b_stats = [team_b_data['average_score'], team_b_data['std_deviation'], team_b_data['variance']]
-        
-        x = range(len(categories))
-        width = 0.35
-        
-        ax4.bar([i - width/2 for i in x], team_a_stats, width, label='Team A', color='lightblue', alpha=0.8)
-        ax4.bar([i + width/2 for i in x], team_b_stats, width, label='Team B', color='lightcoral', alpha=0.8)
-        
-        ax4.set_xlabel('Estadísticas')
-        ax4.set_ylabel('Valor')
-        ax4.set_title('Comparación de Estadísticas Descriptivas')
-        ax4.set_xticks(x)
-        ax4.set_xticklabels(categories)
-        ax4.legend()
-        ax4.grid(True, alpha=0.3)
-        
-        # Añadir valores numéricos sobre las barras para mejor legibilidad
-        for i, (a_stat, b_stat) in enumerate(zip(team_a_stats, team_b_stats)):
-            ax4.text(i - width/2, a_stat + max(team_a_stats + team_b_stats) * 0.01, 
-                    f'{a_stat:.2f}', ha='center', va='bottom', fontsize=9)
-            ax4.text(i + width/2, b_stat + max(team_a_stats + team_b_stats) * 0.01, 
-                    f'{b_stat:.2f}', ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
-        plt.suptitle('Análisis Comparativo de Dispersión - Team A vs Team B', 
-                     fontsize=16, fontweight='bold', y=1.02)
-        plt.show()
-
-    def inverse_erf(self, x):
-        """Aproximación de la función inversa del error para Q-Q plot."""
-        import math
-        
-        if abs(x) >= 1:
-            return 0
-        
-        if x == 0:
-            return 0
-        
-        # Aproximación básica usando método de Beasley-Springer-Moro
-        a = 0.147
-        b = 2 / (math.pi * a) + math.log(1 - x*x) / 2
-        result = math.copysign(math.sqrt(math.sqrt(b*b - math.log(1 - x*x) / a) - b), x)
-        return result
-
+        """Muestra análisis comparativo de dispersión entre ambos equipos (renderizado en segundo plano)."""
+        self.submit_plot("Análisis Comparativo de Dispersión - Team A vs Team B",
+                         render_combined_dispersion_analysis, distribution_data)
 
 # Punto de entrada de la aplicación
 if __name__ == "__main__":